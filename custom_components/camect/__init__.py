@@ -1,6 +1,8 @@
 """The Camect integration."""
 from __future__ import annotations
 
+from typing import Final
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -9,7 +11,7 @@ from homeassistant.helpers import device_registry as dr
 from .camecthub import CamectHub
 from .const import ATTR_CAMECT_MAKE, ATTR_CAMECT_MODEL, DOMAIN
 
-PLATFORMS: list[Platform] = [Platform.CAMERA, Platform.SWITCH, Platform.BINARY_SENSOR]
+PLATFORMS: Final = (Platform.CAMERA, Platform.SWITCH, Platform.BINARY_SENSOR)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -31,11 +33,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sw_version="1.0",
     )
 
-    await hass.config_entries.async_forward_entry_setups(entry, [Platform.CAMERA])
-    await hass.config_entries.async_forward_entry_setups(entry, [Platform.SWITCH])
-    await hass.config_entries.async_forward_entry_setups(
-        entry, [Platform.BINARY_SENSOR]
-    )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
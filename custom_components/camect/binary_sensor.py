@@ -1,9 +1,9 @@
 """Pseudo motion sensors from Camect camera motion alerts."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
 import logging
-from typing import TYPE_CHECKING, Literal
+from time import monotonic
+from typing import TYPE_CHECKING, Final, Literal
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -13,13 +13,15 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_IDENTIFIERS
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import ATTR_MOTION, ATTR_MOTION_LABEL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds after an alert that the motion sensor stays on.
+MOTION_WINDOW: Final = 20.0
+
 if TYPE_CHECKING:
     from .camecthub import CamectHub
     from .camera import Camera as CamectCamera
@@ -33,7 +35,7 @@ async def async_setup_entry(
     """Add binary sensors for a config entry."""
     hub: CamectHub = hass.data[DOMAIN][config_entry.entry_id]
     new_sensors = []
-    for camect_camera in hub.cameras:
+    for camect_camera in hub.cameras.values():
         new_sensors.append(CameraMotionSensor(hub, camect_camera))
     async_add_entities(new_sensors)
 
@@ -54,26 +56,22 @@ class CameraMotionSensor(BinarySensorEntity):
         self.hub = hub
         self.cam = cam
         self.entity_id = f"{self.cam.entity_id}_{ATTR_MOTION}"
-        cam.motion_sensor.append(self)
+        self._attr_unique_id = f"{self.cam.entity_id}_{ATTR_MOTION}"
+        self._attr_device_info = {
+            ATTR_IDENTIFIERS: {(DOMAIN, self.cam.entity_id)},
+        }
+        cam.motion_sensor = self
 
     @property
     def name(self) -> str:
         """Return the name of the binary sensor."""
         return f"{self.cam.name} {ATTR_MOTION_LABEL}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.cam.entity_id}_{ATTR_MOTION}"
-
     @property
     def is_on(self) -> bool:
         """Return true if the Hub reported this camera generated an alert within the last 20 seconds."""
-        if self.cam.last_motion is None:
-            return False
-        if self.cam.last_motion > (datetime.now() - timedelta(seconds=20)):
-            return True
-        return False
+        last_motion = self.cam.last_motion
+        return last_motion is not None and monotonic() - last_motion < MOTION_WINDOW
 
     @property
     def available(self) -> bool:
@@ -85,13 +83,6 @@ class CameraMotionSensor(BinarySensorEntity):
         """Return the appropriate MDI icons."""
         return "mdi:motion-sensor" if self.is_on else "mdi:motion-sensor-off"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        return {
-            ATTR_IDENTIFIERS: {(DOMAIN, self.cam.entity_id)},
-        }
-
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
         """Return the state attributes."""
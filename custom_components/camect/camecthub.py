@@ -1,9 +1,13 @@
 """Code to handle a Camect Hub."""
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+from functools import partial
 import logging
-from typing import TYPE_CHECKING
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Final
 
 import camect
 
@@ -24,10 +28,14 @@ from homeassistant.const import (
     CONF_USERNAME,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .camera import Camera as CamectCamera
 from .const import (
+    API_TIMEOUT,
     ATTR_ALERT,
     ATTR_CAM_OFFLINE,
     ATTR_CAM_ONLINE,
@@ -46,11 +54,22 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    from .camera import Camera as CamectCamera
     from .switch import HubModeSwitch
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_INTERVAL = timedelta(seconds=30)
+_VALID_MODES: Final = frozenset({ATTR_MODE_DEFAULT, ATTR_MODE_HOME})
+
+
+@callback
+def _async_write_state(entity: Entity | None) -> None:
+    """Write an entity's state if it has been added to Home Assistant."""
+    # Events can arrive before the platforms have added their entities, and
+    # entities disabled in the registry are never added at all.
+    if entity is not None and entity.hass is not None:
+        entity.async_write_ha_state()
+
 
 class CamectHub(Entity):
     """Manages a single Camect Hub."""
@@ -67,8 +86,9 @@ class CamectHub(Entity):
         self.hub_name: str = ""
         self.local_https_url: str = ""
         self.mode = ATTR_MODE_DEFAULT
-        self.modeswitch: list[HubModeSwitch] = []
-        self.cameras: list[CamectCamera] = []
+        self.modeswitch: HubModeSwitch | None = None
+        self.cameras: dict[str, CamectCamera] = {}
+        self.coordinator = CamectDataUpdateCoordinator(hass, self)
 
         hass.data.setdefault(DOMAIN, {})[self.config_entry.entry_id] = self
 
@@ -113,13 +133,13 @@ class CamectHub(Entity):
     async def async_initialize_hub(self, hass: HomeAssistant) -> bool:
         """Initialize Connection with the Camect Hub."""
         try:
-            self.api = await hass.async_add_executor_job(
+            self.api = await self.async_api_call(
                 camect.Hub,
                 f"{self.host}:{self.port}",
                 self.username,
                 self.password,
             )
-            await self.update_hub_info()
+            await self.coordinator.async_config_entry_first_refresh()
             self.hub_id = self.info["id"]
             self.id = f"{DOMAIN}_{self.hub_id}"
             self.entity_id = f"{DOMAIN}.{self.id}"
@@ -127,33 +147,54 @@ class CamectHub(Entity):
             self.local_https_url = (
                 self.info["local_https_url"] or f"https://{self.host}:{self.port}"
             )
-            await self.update_mode_property()
-            # pylint: disable=unnecessary-lambda
-            self.api.add_event_listener(lambda evt: self.handle_camect_event(evt))
+            self.setup_cameras()
+            # The Camect library calls listeners from its own thread, so hand
+            # events over to the event loop before touching any HA state.
+            self.api.add_event_listener(
+                partial(
+                    self.hass.loop.call_soon_threadsafe,
+                    self._handle_camect_event_in_loop,
+                )
+            )
 
+        except ConfigEntryNotReady:
+            # Let HA retry setting up the entry later.
+            raise
         except Exception as ex:  # pylint: disable=broad-except
             _LOGGER.exception("Unknown error connecting to hub: %s", str(ex))
             return False
 
         return True
 
-    async def update_hub_info(self) -> None:
-        """Update the info property from the API."""
-        self.info = await self.hass.async_add_executor_job(self.api.get_info)
+    async def async_api_call(
+        self, func: Callable[..., Any], *args: Any, timeout: float = API_TIMEOUT
+    ) -> Any:
+        """Run a blocking Camect API call in the executor with a timeout."""
+        return await asyncio.wait_for(
+            self.hass.async_add_executor_job(func, *args), timeout
+        )
+
+    def setup_cameras(self) -> None:
+        """Create the camera entities from the cached camera list."""
+        # Built here rather than in the camera platform so the other platforms,
+        # which are set up concurrently, can rely on hub.cameras being populated.
+        for json in self.coordinator.data["cameras"].values():
+            CamectCamera(self, json)
 
     async def update_mode_property(self) -> None:
         """Update the mode property."""
-        if self.info["mode"] in (ATTR_MODE_DEFAULT, ATTR_MODE_HOME):
+        if self.info["mode"] in _VALID_MODES:
             self.mode = self.info["mode"]
         else:
             self.mode = ATTR_MODE_DEFAULT
 
-    def handle_camect_event(self, evt):
+    @callback
+    def _handle_camect_event_in_loop(self, evt):
         """Handle an event from the Camect API."""
         try:
             if ATTR_MODE in evt["type"]:
-                if evt["desc"] in (ATTR_MODE_DEFAULT, ATTR_MODE_HOME):
-                    if self.mode in evt["desc"]:
+                if evt["desc"] in _VALID_MODES:
+                    if self.mode == evt["desc"]:
                         # Camect sends a mode change whenever the user has
                         # configured a scheduled change in the Hub's alert
                         # configuration, however the mode itself doesn't
@@ -162,38 +203,33 @@ class CamectHub(Entity):
                         # these events, so for now, we'll just ignore them.
                         return
                     self.mode = evt["desc"]
-                    for modeswitch in self.modeswitch:
-                        modeswitch.schedule_update_ha_state()
+                    _async_write_state(self.modeswitch)
                 else:
                     _LOGGER.warning(
                         "Received mode change event to unknown mode: %s", evt["desc"]
                     )
             elif ATTR_ALERT in evt["type"]:
-                for cam in self.cameras:
-                    if evt["cam_id"] in cam.device_id:
-                        cam.last_motion = datetime.now()
-                        cam.last_detected_obj = evt["detected_obj"] or ATTR_UNKNOWN_OBJ
-                        cam.schedule_update_ha_state()
-                        for motionsensor in cam.motion_sensor:
-                            motionsensor.schedule_update_ha_state()
+                if (cam := self.cameras.get(evt["cam_id"])) is not None:
+                    cam.last_motion = monotonic()
+                    cam.last_detected_obj = evt["detected_obj"] or ATTR_UNKNOWN_OBJ
+                    _async_write_state(cam)
+                    _async_write_state(cam.motion_sensor)
                 self.fire_camera_event(ATTR_ALERT, evt)
             elif ATTR_CAM_OFFLINE in evt["type"]:
                 _LOGGER.info(
                     "Camera %s (ID %s) went offline", evt["cam_name"], evt["cam_id"]
                 )
-                for cam in self.cameras:
-                    if evt["cam_id"] in cam.device_id:
-                        cam.offline = True
-                        cam.schedule_update_ha_state()
+                if (cam := self.cameras.get(evt["cam_id"])) is not None:
+                    cam.offline = True
+                    _async_write_state(cam)
                 self.fire_camera_event(ATTR_CAM_OFFLINE, evt)
             elif ATTR_CAM_ONLINE in evt["type"]:
                 _LOGGER.info(
                     "Camera %s (ID %s) came online", evt["cam_name"], evt["cam_id"]
                 )
-                for cam in self.cameras:
-                    if evt["cam_id"] in cam.device_id:
-                        cam.offline = False
-                        cam.schedule_update_ha_state()
+                if (cam := self.cameras.get(evt["cam_id"])) is not None:
+                    cam.offline = False
+                    _async_write_state(cam)
                 self.fire_camera_event(ATTR_CAM_ONLINE, evt)
             else:
                 _LOGGER.warning("Got an unhandled event type from Camect: %s", str(evt))
@@ -236,6 +272,32 @@ class CamectHub(Entity):
         self.hass.bus.async_fire(EVENT_LOGBOOK_ENTRY, data)
 
 
+class CamectDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Fetch the hub info and camera list once for all of a hub's entities."""
+
+    def __init__(self, hass: HomeAssistant, hub: CamectHub) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=UPDATE_INTERVAL)
+        self.hub = hub
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the latest hub info and camera list from the API."""
+        try:
+            info, cam_json = await asyncio.gather(
+                self.hub.async_api_call(self.hub.api.get_info),
+                self.hub.async_api_call(self.hub.api.list_cameras),
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            raise UpdateFailed(f"Error communicating with hub: {ex}") from ex
+
+        # The mode is also kept up-to-date by events, but this catches any
+        # change we didn't receive an event for.
+        self.hub.info = info
+        await self.hub.update_mode_property()
+
+        return {"cameras": {json["id"]: json for json in cam_json}}
+
+
 async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle ConfigEntry options update."""
     await hass.config_entries.async_reload(entry.entry_id)
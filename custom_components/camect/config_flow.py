@@ -1,10 +1,12 @@
 """Config flow for Camect integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 from urllib.parse import urlparse
 
+import aiohttp
 import camect
 import requests
 import urllib3
@@ -14,8 +16,9 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import API_TIMEOUT, DOMAIN
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -46,7 +49,7 @@ class PlaceholderHub:
         return True
 
 
-def resolve_local_camect_hostname() -> str:
+async def resolve_local_camect_hostname(hass: HomeAssistant) -> str:
     """
     Detect the hostname of the local Camect Hub(s).
 
@@ -55,13 +58,19 @@ def resolve_local_camect_hostname() -> str:
     If a user has multiple, they're likely a power user and can
     manually enter an alternate hostname if they want multiple Hubs in HomeAssistant.
     """
-    resp = requests.get("https://local.home.camect.com/list.json", verify=False)
-    if resp.status_code != 200 or "null" in str(resp.content):
-        # The list API returns the literal text "null" if no local Camect Hubs exist
-        raise Exception(
-            f"Failed to detect 'local_https_url' for Camect Hub: [{resp.status_code}]"
-        )
-    json = resp.json()
+    session = async_get_clientsession(hass)
+    async with session.get(
+        "https://local.home.camect.com/list.json",
+        ssl=False,
+        timeout=aiohttp.ClientTimeout(total=5),
+    ) as resp:
+        content = await resp.text()
+        if resp.status != 200 or "null" in content:
+            # The list API returns the literal text "null" if no local Camect Hubs exist
+            raise Exception(
+                f"Failed to detect 'local_https_url' for Camect Hub: [{resp.status}]"
+            )
+        json = await resp.json(content_type=None)
     if json[0]["url"] is not None:
         return json[0]["url"]
     raise Exception(f"Failed to find first URL object in JSON response: {json}")
@@ -89,18 +98,21 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     if hub_hostname in ("local.home.camect.com", "home.camect.com"):
         # To be helpful, we catch users using home.camect.com too because they're likely used to using that in a browser
-        resolved_hostname = await hass.async_add_executor_job(
-            resolve_local_camect_hostname
-        )
+        resolved_hostname = await resolve_local_camect_hostname(hass)
         hub_hostname = validate_hostname(resolved_hostname)
 
-    hub = await hass.async_add_executor_job(
-        camect.Hub,
-        f"{hub_hostname}:{data['port']}",
-        data["username"],
-        data["password"],
+    hub = await asyncio.wait_for(
+        hass.async_add_executor_job(
+            camect.Hub,
+            f"{hub_hostname}:{data['port']}",
+            data["username"],
+            data["password"],
+        ),
+        API_TIMEOUT,
+    )
+    info = await asyncio.wait_for(
+        hass.async_add_executor_job(hub.get_info), API_TIMEOUT
     )
-    info = await hass.async_add_executor_job(hub.get_info)
 
     # Return info that you want to store in the config entry.
     return {"title": info["name"], "id": info["id"], "host": hub_hostname}
@@ -127,12 +139,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(info["id"])
             self._abort_if_unique_id_configured()
             user_input["host"] = info["host"]
-        except requests.exceptions.Timeout as ex:
+        except (requests.exceptions.Timeout, asyncio.TimeoutError) as ex:
             errors["base"] = "cannot_connect"
             _LOGGER.exception("Timeout exception: %s", str(ex))
         except requests.exceptions.RequestException as ex:
             errors["base"] = "cannot_connect"
             _LOGGER.exception("Generic request exception: %s", str(ex))
+        except aiohttp.ClientError as ex:
+            errors["base"] = "cannot_connect"
+            _LOGGER.exception("Client error resolving local hub: %s", str(ex))
         except Exception as ex:  # pylint: disable=broad-except
             exs = str(ex)
             if "401" in exs:
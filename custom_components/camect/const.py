@@ -9,6 +9,9 @@ ATTR_MODE_DEFAULT = "DEFAULT"
 ATTR_MODE_HOME = "HOME"
 ATTR_MODE_REASON = "HomeAssistant"
 
+# Seconds to wait for a Camect API call before giving up.
+API_TIMEOUT = 10
+
 ATTR_MOTION = "motion"
 ATTR_MOTION_LABEL = "Motion"
 
@@ -9,8 +9,9 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_IDENTIFIERS, ATTR_MODE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTR_ALERT_DISABLED,
@@ -23,9 +24,12 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    from .camecthub import CamectHub
+    from .camecthub import CamectDataUpdateCoordinator, CamectHub
     from .camera import Camera as CamectCamera
 
+ICON_MODE_DEFAULT = "mdi:shield-check"
+ICON_MODE_HOME = "mdi:home"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,7 +40,7 @@ async def async_setup_entry(
     hub: CamectHub = hass.data[DOMAIN][config_entry.entry_id]
     new_switches: list[SwitchEntity] = []
     new_switches.append(HubModeSwitch(hub))
-    for camect_camera in hub.cameras:
+    for camect_camera in hub.cameras.values():
         new_switches.append(CameraAlertSwitch(hub, camect_camera))
 
     async_add_entities(new_switches)
@@ -53,25 +57,17 @@ class CameraAlertSwitch(SwitchEntity):
         self.hub = hub
         self.cam = cam
         self.entity_id = f"{self.cam.entity_id}_{ATTR_ALERT_DISABLED}"
-        cam.alert_switch.append(self)
+        self._attr_unique_id = f"{self.cam.entity_id}_{ATTR_MODE}"
+        self._attr_device_info = {
+            ATTR_IDENTIFIERS: {(DOMAIN, self.cam.entity_id)},
+        }
+        cam.alert_switch = self
 
     @property
     def name(self) -> str:
         """Return the human-friendly name of this switch."""
         return f"{self.cam.name} {ATTR_ALERT_ENABLED}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of this switch."""
-        return f"{self.cam.entity_id}_{ATTR_MODE}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        return {
-            ATTR_IDENTIFIERS: {(DOMAIN, self.cam.entity_id)},
-        }
-
     @property
     def icon(self) -> str:
         """Return the appropriate MDI icon."""
@@ -89,18 +85,22 @@ class CameraAlertSwitch(SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable alerts for this camera."""
-        await self.hass.async_add_executor_job(
+        await self.hub.async_api_call(
             self.hub.api.enable_alert, self.cam.device_id, ATTR_MODE_REASON
         )
+        self.cam.is_alert_disabled = False
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable alerts for this camera."""
-        await self.hass.async_add_executor_job(
+        await self.hub.async_api_call(
             self.hub.api.disable_alert, self.cam.device_id, ATTR_MODE_REASON
         )
+        self.cam.is_alert_disabled = True
+        self.async_write_ha_state()
 
 
-class HubModeSwitch(SwitchEntity):
+class HubModeSwitch(CoordinatorEntity["CamectDataUpdateCoordinator"], SwitchEntity):
     """
     An implementation of a switch within Camect Hub.
 
@@ -109,53 +109,40 @@ class HubModeSwitch(SwitchEntity):
 
     def __init__(self, hub: CamectHub) -> None:
         """Initialize a switch within by Camect Hub."""
-        super().__init__()
+        super().__init__(hub.coordinator)
         self.hub = hub
         self.entity_id = f"{switch.DOMAIN}.{self.hub.id}_{ATTR_MODE}"
-        hub.modeswitch.append(self)
-
-    async def async_update(self) -> None:
-        """Ensure the mode is kept up-to-date in case we don't receive an event of it being changed outside of HA."""
-        await self.hub.update_hub_info()
-        await self.hub.update_mode_property()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        return {
+        self._attr_name = f"{self.hub.name} {ATTR_HUB_MODE}"
+        self._attr_unique_id = f"{self.hub.id}_{ATTR_MODE}"
+        self._attr_device_info = {
             ATTR_IDENTIFIERS: {(DOMAIN, self.hub.id)},
         }
-
-    @property
-    def name(self) -> str:
-        """Return the human-friendly name of this switch."""
-        return f"{self.hub.name} {ATTR_HUB_MODE}"
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of this switch."""
-        return f"{self.hub.id}_{ATTR_MODE}"
+        hub.modeswitch = self
 
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        return self.hub.mode in ATTR_MODE_DEFAULT
+        return self.hub.mode == ATTR_MODE_DEFAULT
 
     @property
     def icon(self) -> str:
         """Return the closest MDI icons to what the Camect Hub v2 UI displays."""
-        return "mdi:shield-check" if self.hub.mode in ATTR_MODE_DEFAULT else "mdi:home"
+        if self.hub.mode == ATTR_MODE_DEFAULT:
+            return ICON_MODE_DEFAULT
+        return ICON_MODE_HOME
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Set the mode to Default."""
-        await self.hass.async_add_executor_job(
+        await self.hub.async_api_call(
             self.hub.api.set_mode, ATTR_MODE_DEFAULT, ATTR_MODE_REASON
         )
-        await self.hub.update_mode_property()
+        self.hub.mode = ATTR_MODE_DEFAULT
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Set the mode to Home."""
-        await self.hass.async_add_executor_job(
+        await self.hub.async_api_call(
             self.hub.api.set_mode, ATTR_MODE_HOME, ATTR_MODE_REASON
         )
-        await self.hub.update_mode_property()
+        self.hub.mode = ATTR_MODE_HOME
+        self.async_write_ha_state()